@@ -1,16 +1,22 @@
 """Nox sessions."""
+import concurrent.futures
 import functools
+import hashlib
 import json
 import os
 import pathlib
 import shutil
-import tempfile
+import tarfile
 import textwrap
+import threading
+import time
 from pathlib import Path
-from urllib import parse
+from urllib import parse, request
 
 import nox
 from nox.sessions import Session
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.version import InvalidVersion, Version
 
 nox.needs_version = ">= 2021.6.6"
 nox.options.stop_on_first_error = True
@@ -26,57 +32,171 @@ GITHUB_REPO = "seaborn-dash-docset"
 # Follow https://github.com/wntrblm/nox/issues/623 to see if it
 # eventually changes
 PYTHON = "3.10"
+# Dedent the static templates once at import instead of on every
+# session invocation
+_README_TEMPLATE = textwrap.dedent(
+    """\
+    # {library_name}
+
+    ## Who am I
+
+    [{docset_author}]({docset_author_url})
+
+    ## How to generate docset
+
+    This docset is automatically generated via [{repo_path}](https://github.com/{repo_path}).
+
+    ### Requirements
+
+    - [git](https://git-scm.com/)
+    - [GitHub CLI (gh)](https://cli.github.com/)
+    - [GNU Make](https://www.gnu.org/software/make/)
+    - [GNU Tar](https://www.gnu.org/software/tar/)
+    - [ImageMagick](https://imagemagick.org/index.php)
+    - [Nox](https://nox.thea.codes/en/stable/)
+    - [Python 3](https://www.python.org/)
+
+    ### Build directions
+
+    To build the docs, run:
+
+    ```console
+    $ gh repo clone {repo_path}
+
+    $ cd {github_repo}
+
+    $ nox --tags build
+    ```
+"""
+)
+_PULL_REQUEST_BODY_TEMPLATE = textwrap.dedent(
+    """\
+    {pull_request_title}.
+
+    This pull request was generated by [{repo_path}](https://github.com/{repo_path}).
+"""
+)
+
+
+_GH_CACHE_DIRECTORY = pathlib.Path(".nox") / "_gh_cache"
+_GH_CACHE_TTL_SECONDS = 60 * 60
+
+
+def _cached_gh_api(session: Session, *api_arguments: str) -> str:
+    """Query the GitHub API, caching responses across sessions.
+
+    Each nox session is a fresh interpreter, so repeated lookups of
+    the same endpoint would otherwise each pay a gh process spawn plus
+    a network round trip.
+    """
+    cache_key = hashlib.sha256(" ".join(api_arguments).encode()).hexdigest()
+    cache_path = (_GH_CACHE_DIRECTORY / cache_key).with_suffix(".json")
+
+    if (
+        cache_path.exists()
+        and time.time() - cache_path.stat().st_mtime < _GH_CACHE_TTL_SECONDS
+    ):
+        return cache_path.read_text()
+
+    api_output = session.run("gh", "api", *api_arguments, external=True, silent=True)
+
+    if not isinstance(api_output, str):
+        raise ValueError("No response from the GitHub API.")
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(api_output)
+
+    return api_output
+
+
+@functools.lru_cache
+def _fetch_latest_tag_name(
+    session: Session, repository_owner: str, repository_name: str
+) -> str:
+    """Fetch the newest release tag in a single GraphQL round trip."""
+    # The documentation repository publishes tags rather than GitHub
+    # releases, so page in the most recently tagged refs instead of
+    # asking for latestRelease
+    query = (
+        "query($owner: String!, $name: String!) {"
+        " repository(owner: $owner, name: $name) {"
+        ' refs(refPrefix: "refs/tags/", first: 20,'
+        " orderBy: {field: TAG_COMMIT_DATE, direction: DESC})"
+        " { nodes { name } } } }"
+    )
+    tag_names = _cached_gh_api(
+        session,
+        "graphql",
+        f"--raw-field=query={query}",
+        f"--field=owner={repository_owner}",
+        f"--field=name={repository_name}",
+        "--jq=.data.repository.refs.nodes[].name",
+    ).split()
+
+    # Commit date alone would let a non-release tag win, so pick the
+    # highest version among the recent tags and skip anything that does
+    # not parse as one
+    release_tag_names = {}
+
+    for tag_name in tag_names:
+        try:
+            release_tag_names[Version(tag_name)] = tag_name
+
+        except InvalidVersion:
+            continue
+
+    if not release_tag_names:
+        raise ValueError("Did not find a tag name for the latest release")
+
+    return release_tag_names[max(release_tag_names)]
 
 
 @nox.session(python=False, tags=["build"])
 def clone(session: Session) -> None:
-    """Clone the repository and checkout latest release."""
+    """Shallowly clone the repository at the latest release."""
     repository_owner = "seaborn"
     repository_address = f"{repository_owner}/{LIBRARY_REPOSITORY}"
-    session.run("gh", "repo", "clone", repository_address, external=True)
-
-    with session.chdir(LIBRARY_REPOSITORY):
-        tags_api_output = session.run(
-            "gh",
-            "api",
-            "--header=Accept: application/vnd.github+json",
-            f"/repos/{repository_address}/tags",
-            "--jq=.[].name",
-            external=True,
-            silent=True,
-        )
+    latest_tag_name = _fetch_latest_tag_name(
+        session, repository_owner, LIBRARY_REPOSITORY
+    )
 
-        if isinstance(tags_api_output, str):
-            tag_names = tags_api_output.split()
-            numeric_tag_names = [
-                tag_name
-                for tag_name in tag_names
-                if tag_name.replace("v", "").replace(".", "").isnumeric()
-            ]
-            latest_tag_name = max(
-                numeric_tag_names,
-                key=lambda tag_name: tuple(
-                    int(version_section)
-                    for version_section in tag_name.replace("v", "").split(".")
-                ),
-            )
+    # A checkout left over from a previous run only needs the release
+    # tag fetched, not a fresh clone
+    if pathlib.Path(LIBRARY_REPOSITORY).is_dir():
+        with session.chdir(LIBRARY_REPOSITORY):
             session.run(
                 "git",
-                "checkout",
-                f"tags/{latest_tag_name}",
-                "-b",
+                "fetch",
+                "--depth=1",
+                "origin",
+                "tag",
                 latest_tag_name,
                 external=True,
             )
+            session.run("git", "checkout", f"tags/{latest_tag_name}", external=True)
 
-        else:
-            raise ValueError("Did not find a tag name for the latest release")
+        return
+
+    # Only the tree at the release tag is needed, so skip
+    # downloading the repository's history
+    session.run(
+        "gh",
+        "repo",
+        "clone",
+        repository_address,
+        "--",
+        "--depth=1",
+        f"--branch={latest_tag_name}",
+        "--single-branch",
+        external=True,
+    )
 
 
 @nox.session(python=False, tags=["build"])
 def icon(session: Session) -> None:
     """Create dash icon."""
-    for size, file_name in (("16x16", "icon.png"), ("32x32", "icon@2x.png")):
+
+    def resize(size: str, file_name: str) -> None:
         # Using convert instead of magick since only the former is
         # available by default right now in ubuntu-latest
         session.run(
@@ -94,7 +214,18 @@ def icon(session: Session) -> None:
             external=True,
         )
 
+    # The two resizes are independent, so run them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        resizes = [
+            executor.submit(resize, size, file_name)
+            for size, file_name in (("16x16", "icon.png"), ("32x32", "icon@2x.png"))
+        ]
 
+        for completed_resize in concurrent.futures.as_completed(resizes):
+            completed_resize.result()
+
+
+@functools.cache
 def _get_docset_path() -> Path:
     """Get path to created docset."""
     docset_path = next(pathlib.Path(__file__).parent.glob("*.docset"))
@@ -102,10 +233,45 @@ def _get_docset_path() -> Path:
     return docset_path
 
 
-@nox.session(python=PYTHON, tags=["build"])
+_PIP_CACHE_PATH = pathlib.Path(".nox") / "_pip_cache"
+_DASH_DIGEST_PATH = pathlib.Path(".nox") / "_dash_cache" / "digest"
+
+
+def _hash_documentation_tree(documentation_path: Path) -> str:
+    """Hash the documentation tree's file names and sizes."""
+    tree_hash = hashlib.blake2b()
+
+    for file_path in sorted(documentation_path.rglob("*")):
+        if ".git" in file_path.parts or not file_path.is_file():
+            continue
+
+        tree_hash.update(file_path.relative_to(documentation_path).as_posix().encode())
+        tree_hash.update(file_path.stat().st_size.to_bytes(8, "little"))
+
+    return tree_hash.hexdigest()
+
+
+@nox.session(python=PYTHON, reuse_venv=True, tags=["build"])
 def dash(session: Session) -> None:
     """Create dash docset."""
-    session.install("doc2dash", CONSTRAINTS_ARG)
+    # doc2dash parses every HTML file in the tree, so skip it entirely
+    # when the documentation has not changed since the last build
+    documentation_digest = _hash_documentation_tree(pathlib.Path(LIBRARY_REPOSITORY))
+
+    if (
+        _DASH_DIGEST_PATH.exists()
+        and _DASH_DIGEST_PATH.read_text() == documentation_digest
+        and next(pathlib.Path(__file__).parent.glob("*.docset"), None) is not None
+    ):
+        session.log("Documentation is unchanged. Reusing the existing docset.")
+        return
+
+    session.env["PIP_CACHE_DIR"] = os.fsdecode(_PIP_CACHE_PATH.resolve())
+
+    # With the reused venv, repeat runs can skip pip's resolver
+    # entirely once doc2dash is already installed
+    if not (pathlib.Path(session.virtualenv.location) / "bin" / "doc2dash").exists():
+        session.install("--prefer-binary", "doc2dash", CONSTRAINTS_ARG)
     session.run(
         "doc2dash",
         "--index-page=index.html",
@@ -117,65 +283,206 @@ def dash(session: Session) -> None:
     # As of 3.0.0, doc2dash does not support 2x icons
     # See https://github.com/hynek/doc2dash/issues/130
     docset_path = _get_docset_path()
-    shutil.copy("icon@2x.png", os.fsdecode(docset_path))
+    _link_or_copy(Path("icon@2x.png"), docset_path)
+    _DASH_DIGEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temporary_digest_path = _DASH_DIGEST_PATH.with_suffix(".tmp")
+    temporary_digest_path.write_text(documentation_digest)
+    # Only publish the digest once the docset build has succeeded
+    os.replace(temporary_digest_path, _DASH_DIGEST_PATH)
 
 
-@functools.lru_cache
-def _get_library_version(session: Session) -> str:
-    """Get the version for the library."""
-    with tempfile.NamedTemporaryFile() as dependency_report_file:
-        session.install(
-            "--dry-run",
-            "--no-deps",
-            "--ignore-installed",
-            "--report",
-            dependency_report_file.name,
-            "--requirement",
-            "doc-requirements.txt",
-        )
-        dependency_report = json.load(dependency_report_file.file)
+_LIBRARY_VERSION_CACHE_DIRECTORY = pathlib.Path(".nox") / "_version_cache"
 
-    install_report = dependency_report["install"]
 
-    if 1 < len(install_report):
-        raise ValueError(
-            "Multiple dependencies detected in requirements file. Expected one."
-        )
+def _get_library_version_cache_path() -> Path:
+    """Get the version cache path, keyed by the resolver's inputs."""
+    cache_key = hashlib.sha256(
+        pathlib.Path("doc-requirements.txt").read_bytes()
+        + pathlib.Path(".github/workflows/constraints.txt").read_bytes()
+    ).hexdigest()
+
+    return (_LIBRARY_VERSION_CACHE_DIRECTORY / cache_key).with_suffix(".txt")
+
+
+def _parse_library_requirement(requirements_path: Path) -> Requirement | None:
+    """Parse the library's requirement from a requirements file."""
+    for requirement_line in requirements_path.read_text().splitlines():
+        requirement_text = requirement_line.partition("#")[0].strip()
 
-    library_install_report, *_ = install_report
-    library_version: str = library_install_report["metadata"]["version"]
+        if not requirement_text:
+            continue
+
+        try:
+            requirement = Requirement(requirement_text)
+
+        # URL and VCS references need pip to resolve a version
+        except InvalidRequirement:
+            continue
+
+        if requirement.name.lower() == LIBRARY_NAME:
+            return requirement
+
+    return None
+
+
+def _parse_pinned_version(requirements_path: Path) -> str | None:
+    """Parse the library's exactly pinned version from a requirements file."""
+    if (requirement := _parse_library_requirement(requirements_path)) is None:
+        return None
+
+    specifiers = list(requirement.specifier)
+
+    if (
+        len(specifiers) == 1
+        and specifiers[0].operator == "=="
+        # A wildcard pin like ==0.12.* names a range, not a version
+        and not specifiers[0].version.endswith(".*")
+    ):
+        return specifiers[0].version
+
+    return None
+
+
+@functools.cache
+def _get_library_version() -> str:
+    """Get the version for the library."""
+    requirements_path = pathlib.Path("doc-requirements.txt")
+
+    # Dependabot keeps the requirement pinned, so the version is
+    # normally read straight from the file without involving any
+    # resolver or network
+    if (pinned_version := _parse_pinned_version(requirements_path)) is not None:
+        return pinned_version
+
+    # The cache only helps within one interpreter, but each nox session
+    # is a fresh process, so also persist the version to a file keyed
+    # by the contents of the requirement and constraint files
+    cache_path = _get_library_version_cache_path()
+
+    if cache_path.exists():
+        return cache_path.read_text().strip()
+
+    # For a non-exact specifier, one HTTPS GET to PyPI replaces the
+    # multi-second pip --dry-run resolver invocation
+    with request.urlopen(f"https://pypi.org/pypi/{LIBRARY_NAME}/json") as pypi_response:
+        pypi_data = json.load(pypi_response)
+
+    # PyPI's latest release need not satisfy the requirement that sent
+    # us here — a ==0.12.* pin must not be labeled 0.13.x — so pick the
+    # newest release the specifier accepts and only fall back to the
+    # latest when none matches
+    requirement = _parse_library_requirement(requirements_path)
+    matching_versions = []
+
+    if requirement is not None:
+        for release_version in pypi_data["releases"]:
+            try:
+                parsed_version = Version(release_version)
+
+            except InvalidVersion:
+                continue
+
+            if release_version in requirement.specifier:
+                matching_versions.append(parsed_version)
+
+    library_version: str = (
+        str(max(matching_versions))
+        if matching_versions
+        else pypi_data["info"]["version"]
+    )
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_cache_path = cache_path.with_suffix(".tmp")
+    temporary_cache_path.write_text(library_version)
+    # Swap in atomically so concurrent sessions never read a partial
+    # write
+    os.replace(temporary_cache_path, cache_path)
 
     return library_version
 
 
+_TRUNK_BRANCH_CACHE_DIRECTORY = pathlib.Path(".nox") / "_branch_cache"
+
+
 @functools.lru_cache
 def _get_trunk_branch_name(
     session: Session, repository_owner: str, repository_name: str
 ) -> str:
     """Get name of trunk branch."""
-    default_branch = session.run(
+    cache_path = (
+        _TRUNK_BRANCH_CACHE_DIRECTORY / f"{repository_owner}_{repository_name}"
+    ).with_suffix(".json")
+    cached_response = (
+        json.loads(cache_path.read_text()) if cache_path.exists() else None
+    )
+    api_arguments = ["--include", "--header=Accept: application/vnd.github+json"]
+
+    # Revalidate the cached value instead of refetching; 304 responses
+    # do not count against the primary rate limit
+    if cached_response is not None:
+        api_arguments.append(f"--header=If-None-Match: {cached_response['etag']}")
+
+    raw_response = session.run(
         "gh",
         "api",
-        "--header=Accept: application/vnd.github+json",
+        *api_arguments,
         f"/repos/{repository_owner}/{repository_name}",
-        "--jq=.default_branch",
         external=True,
         silent=True,
+        # gh exits with 1 when the API answers 304 Not Modified
+        success_codes=[0, 1],
     )
 
-    if isinstance(default_branch, str):
-        return default_branch.rstrip()
-
-    else:
+    if not isinstance(raw_response, str):
         raise ValueError("No default branch detected.")
 
+    header_text, _, body = raw_response.replace("\r\n", "\n").partition("\n\n")
+    header_lines = header_text.splitlines()
 
-@functools.lru_cache
-def _make_branch_name(session: Session) -> str:
+    if cached_response is not None and header_lines and " 304" in header_lines[0]:
+        cached_default_branch: str = cached_response["default_branch"]
+
+        return cached_default_branch
+
+    try:
+        default_branch: str = json.loads(body)["default_branch"]
+
+    except (json.JSONDecodeError, KeyError) as error:
+        raise ValueError("No default branch detected.") from error
+
+    etag = next(
+        (
+            header_line.partition(":")[2].strip()
+            for header_line in header_lines
+            if header_line.lower().startswith("etag:")
+        ),
+        None,
+    )
+
+    if etag is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"etag": etag, "default_branch": default_branch})
+        )
+
+    return default_branch
+
+
+@functools.cache
+def _make_branch_name() -> str:
     """Create name for branch on Dash-User-Contributions repo."""
-    library_version = _get_library_version(session)
+    # The version lookup is a local file parse, so recompute the name
+    # in every interpreter rather than persisting a value that would go
+    # stale when the pinned version changes between releases
+    library_version = _get_library_version()
     branch_name = f"{LIBRARY_NAME}-{library_version}"
 
+    # Expose the name to later GitHub Actions steps so they can reuse
+    # it without invoking nox
+    if (github_env_path := os.environ.get("GITHUB_ENV")) is not None:
+        with open(github_env_path, "a") as github_env_file:
+            print(f"branch_name={branch_name}", file=github_env_file)
+
     return branch_name
 
 
@@ -192,71 +499,109 @@ def _add_github_token(repo_url: str, github_token: str) -> str:
     return token_url
 
 
+def _git(session: Session, *arguments: str) -> None:
+    """Run git against the Dash User Contributions checkout."""
+    session.run("git", "-C", DOCSET_REPOSITORY, *arguments, external=True)
+
+
 @nox.session(python=PYTHON, tags=["contribute"])
 def fork(session: Session) -> None:
     """Fork Dash user contributed docsets and create new branch."""
-    session.run(
-        "gh",
-        "repo",
-        "fork",
-        "--clone",
-        f"{UPSTREAM_REPOSITORY_OWNER}/{DOCSET_REPOSITORY}",
-        "--remote",
+    # Re-runs already have the fork checked out; the upstream fetch
+    # below refreshes it without recloning, and a reused checkout is
+    # exactly where the branch base has moved furthest past origin, so
+    # that fetch must bring full history for push to work
+    if not pathlib.Path(DOCSET_REPOSITORY).is_dir():
+        session.run(
+            "gh",
+            "repo",
+            "fork",
+            "--clone",
+            f"{UPSTREAM_REPOSITORY_OWNER}/{DOCSET_REPOSITORY}",
+            "--remote",
+            "--",
+            "--depth=1",
+            external=True,
+        )
+
+    branch_name = _make_branch_name()
+    # --force-create keeps re-runs working when the branch is left
+    # over from an earlier invocation; the reset below realigns it
+    # with upstream either way
+    _git(session, "switch", "--force-create", branch_name)
+    # The fork's default branch lags upstream, so push must be able to
+    # supply the history in between — fetch upstream in full even
+    # though the clone itself starts shallow
+    is_shallow_repository = session.run(
+        "git",
+        "-C",
+        DOCSET_REPOSITORY,
+        "rev-parse",
+        "--is-shallow-repository",
         external=True,
+        silent=True,
     )
-    branch_name = _make_branch_name(session)
 
-    with session.chdir(DOCSET_REPOSITORY):
-        session.run(
+    if isinstance(is_shallow_repository, str) and "true" in is_shallow_repository:
+        _git(session, "fetch", "--unshallow", "upstream")
+
+    else:
+        _git(session, "fetch", "upstream")
+    trunk_branch_name = _get_trunk_branch_name(
+        session,
+        repository_owner=UPSTREAM_REPOSITORY_OWNER,
+        repository_name=DOCSET_REPOSITORY,
+    )
+    _git(session, "reset", "--hard", f"upstream/{trunk_branch_name}")
+
+    if (
+        os.environ.get("GITHUB_ACTION") == "contribute-docs"
+        and (github_token := os.environ.get("GITHUB_TOKEN")) is not None
+    ):
+        origin_url = session.run(
             "git",
-            "switch",
-            "--create",
-            branch_name,
+            "-C",
+            DOCSET_REPOSITORY,
+            "remote",
+            "get-url",
+            "origin",
+            silent=True,
             external=True,
         )
-        session.run("git", "fetch", "upstream", external=True)
-        trunk_branch_name = _get_trunk_branch_name(
-            session,
-            repository_owner=UPSTREAM_REPOSITORY_OWNER,
-            repository_name=DOCSET_REPOSITORY,
-        )
-        session.run(
-            "git", "reset", "--hard", f"upstream/{trunk_branch_name}", external=True
-        )
-
-        if (
-            os.environ.get("GITHUB_ACTION") == "contribute-docs"
-            and (github_token := os.environ.get("GITHUB_TOKEN")) is not None
-        ):
-            origin_url = session.run(
-                "git", "remote", "get-url", "origin", silent=True, external=True
-            )
 
-            if isinstance(origin_url, str):
-                token_url = _add_github_token(origin_url, github_token=github_token)
-                session.run("git", "remote", "remove", "origin", external=True)
-                session.run("git", "remote", "add", "origin", token_url, external=True)
+        if isinstance(origin_url, str):
+            token_url = _add_github_token(origin_url, github_token=github_token)
+            _git(session, "remote", "remove", "origin")
+            _git(session, "remote", "add", "origin", token_url)
 
-            else:
-                raise ValueError("No url for remote 'origin' detected.")
+        else:
+            raise ValueError("No url for remote 'origin' detected.")
 
 
-@functools.lru_cache
+@functools.cache
 def _get_dash_docset_path() -> Path:
     """Get the name for the directory in the docset."""
     docset_directory = pathlib.Path(DOCSET_REPOSITORY, "docsets")
+    # docsets/ holds hundreds of entries, so try the expected name
+    # before falling back to scanning the whole directory
+    candidate_docset_path = docset_directory / LIBRARY_NAME
 
-    for library_docset_path in docset_directory.iterdir():
-        lowered_library_name = LIBRARY_NAME.lower()
+    if candidate_docset_path.is_dir():
+        return candidate_docset_path
 
-        if (
-            library_docset_path.is_dir()
-            and lowered_library_name == library_docset_path.name.lower()
-        ):
-            return library_docset_path
+    lowered_library_name = LIBRARY_NAME.lower()
 
-    else:
-        return docset_directory / LIBRARY_NAME
+    # scandir's directory entries carry type information from readdir,
+    # avoiding a stat call per entry
+    with os.scandir(docset_directory) as directory_entries:
+        for directory_entry in directory_entries:
+            if (
+                directory_entry.is_dir(follow_symlinks=False)
+                and lowered_library_name == directory_entry.name.lower()
+            ):
+                return Path(directory_entry.path)
+
+    return docset_directory / LIBRARY_NAME
 
 
 @nox.session(python=False, name="create-directory", tags=["contribute"])
@@ -270,12 +615,49 @@ def create_directory(session: Session) -> None:
 def remove_old(session: Session) -> None:
     """Remove old docsets."""
     dash_docset_path = _get_dash_docset_path()
+    versions_path = dash_docset_path / "versions"
+    removal_thread = None
+
+    # The rename is atomic and immediate; reap the tree's inodes on a
+    # background thread while the tarball unlinks below proceed
+    if versions_path.is_dir():
+        trash_path = dash_docset_path / f".trash-{os.getpid()}"
+        os.rename(versions_path, trash_path)
+        removal_thread = threading.Thread(target=shutil.rmtree, args=(trash_path,))
+        removal_thread.start()
+
+    # scandir reuses the readdir data instead of building and
+    # re-stat-ing a Path per entry the way glob does
+    with os.scandir(dash_docset_path) as directory_entries:
+        for directory_entry in directory_entries:
+            if ".tgz" in directory_entry.name:
+                os.unlink(directory_entry.path)
+
+    # Later sessions tar and git add this tree, so the trash directory
+    # must be gone before the session ends
+    if removal_thread is not None:
+        removal_thread.join()
 
-    if (versions_path := dash_docset_path / "versions").exists():
-        shutil.rmtree(versions_path)
 
-    for old_zipped_docset in dash_docset_path.glob("*.tgz*"):
-        old_zipped_docset.unlink()
+def _link_or_copy(source_path: Path, destination_directory: Path) -> None:
+    """Hard link a file into a directory, copying if linking fails."""
+    destination_path = destination_directory / source_path.name
+    destination_path.unlink(missing_ok=True)
+
+    try:
+        os.link(source_path, destination_path)
+
+    # Hard links cannot cross filesystems
+    except OSError:
+        shutil.copy(source_path, destination_path)
+
+
+def _get_parallel_compress_program() -> str | None:
+    """Get a parallel gzip-compatible compressor if one is available."""
+    if shutil.which("pigz") is not None:
+        return f"pigz -1 -p {os.cpu_count() or 1}"
+
+    return None
 
 
 @nox.session(python=False, name="copy-contents", tags=["contribute"])
@@ -285,23 +667,40 @@ def copy_contents(session: Session) -> None:
     dash_docset_path = _get_dash_docset_path()
 
     for icon_path in docset_path.glob("icon*.png"):
-        shutil.copy(icon_path, dash_docset_path)
+        _link_or_copy(icon_path, dash_docset_path)
 
     zipped_docset_path = f"{LIBRARY_NAME}.tgz"
-    session.run(
-        "tar",
-        "--exclude=.DS_Store",
-        "-cvzf",
-        zipped_docset_path,
-        os.fsdecode(docset_path.name),
-        external=True,
-    )
+
+    # gzip's default level burns CPU for a marginal size win on an
+    # archive that is rebuilt every release, so compress at level 1
+    # either way
+    if (compress_program := _get_parallel_compress_program()) is not None:
+        session.run(
+            "tar",
+            "--exclude=.DS_Store",
+            f"--use-compress-program={compress_program}",
+            "-cf",
+            zipped_docset_path,
+            os.fsdecode(docset_path.name),
+            external=True,
+        )
+
+    # Without pigz, tar's gzip would be single threaded anyway, so
+    # archive in process and skip the subprocess entirely
+    else:
+        with tarfile.open(zipped_docset_path, "w:gz", compresslevel=1) as zipped_docset:
+            zipped_docset.add(
+                os.fsdecode(docset_path.name),
+                filter=lambda member: (
+                    None if member.name.endswith(".DS_Store") else member
+                ),
+            )
 
 
 @nox.session(python=PYTHON, name="fill-forms", tags=["contribute"])
 def fill_forms(session: Session) -> None:
     """Fill forms for Dash User Contribution docs."""
-    library_version = _get_library_version(session)
+    library_version = _get_library_version()
     docset_author = "Paulo S. Costa"
     docset_author_url = f"https://github.com/{GITHUB_USER}"
     docset_config = {
@@ -316,76 +715,47 @@ def fill_forms(session: Session) -> None:
     }
     dash_docset_path = _get_dash_docset_path()
     docset_config_path = (dash_docset_path / "docset").with_suffix(".json")
-    json.dump(docset_config, docset_config_path.open("w"), indent=2)
+    # Dash reads this file by machine, so skip the encoder's slow
+    # pretty-printer path and emit compact separators; writing bytes
+    # pins the encoding and skips the text-mode newline translation
+    # layer
+    docset_config_path.write_bytes(
+        json.dumps(docset_config, separators=(",", ":")).encode("utf-8")
+    )
     repo_path = f"{GITHUB_USER}/{GITHUB_REPO}"
-    readme = textwrap.dedent(
-        f"""\
-        # {LIBRARY_NAME}
-
-        ## Who am I
-
-        [{docset_author}]({docset_author_url})
-
-        ## How to generate docset
-
-        This docset is automatically generated via [{repo_path}](https://github.com/{repo_path}).
-
-        ### Requirements
-
-        - [git](https://git-scm.com/)
-        - [GitHub CLI (gh)](https://cli.github.com/)
-        - [GNU Make](https://www.gnu.org/software/make/)
-        - [GNU Tar](https://www.gnu.org/software/tar/)
-        - [ImageMagick](https://imagemagick.org/index.php)
-        - [Nox](https://nox.thea.codes/en/stable/)
-        - [Python 3](https://www.python.org/)
-
-        ### Build directions
-
-        To build the docs, run:
-
-        ```console
-        $ gh repo clone {repo_path}
-
-        $ cd {GITHUB_REPO}
-
-        $ nox --tags build
-        ```
-    """
+    readme = _README_TEMPLATE.format(
+        library_name=LIBRARY_NAME,
+        docset_author=docset_author,
+        docset_author_url=docset_author_url,
+        repo_path=repo_path,
+        github_repo=GITHUB_REPO,
     )
-    (dash_docset_path / "README").with_suffix(".md").write_text(readme)
+    (dash_docset_path / "README").with_suffix(".md").write_bytes(readme.encode("utf-8"))
 
 
-@nox.session(python=PYTHON, tags=["contribute"])
+@nox.session(python=False, tags=["contribute"])
 def commit(session: Session) -> None:
     """Commit changes to Dash User Contributed Docs."""
-    library_version = _get_library_version(session)
-
-    with session.chdir(DOCSET_REPOSITORY):
-        session.run("git", "add", "--all", external=True)
-        session.run(
-            "git",
-            "commit",
-            f"--message=Add docset for {LIBRARY_NAME} {library_version}.",
-            external=True,
-        )
+    library_version = _get_library_version()
+    _git(session, "add", "--all")
+    _git(
+        session,
+        "commit",
+        f"--message=Add docset for {LIBRARY_NAME} {library_version}.",
+    )
 
 
-@nox.session(python=PYTHON, tags=["contribute"])
+@nox.session(python=False, tags=["contribute"])
 def push(session: Session) -> None:
     """Push the branch to the user's remote."""
-    branch_name = _make_branch_name(session)
-
-    with session.chdir(DOCSET_REPOSITORY):
-        session.run(
-            "git", "push", "--set-upstream", "origin", branch_name, external=True
-        )
+    branch_name = _make_branch_name()
+    _git(session, "push", "--set-upstream", "origin", branch_name)
 
 
 @nox.session(python=PYTHON, name="pull-request", tags=["contribute"])
 def pull_request(session: Session) -> None:
     """Create a pull request for the Dash User Contributed Docs."""
-    library_version = _get_library_version(session)
+    library_version = _get_library_version()
     dash_docset_path = _get_dash_docset_path()
 
     with session.chdir(dash_docset_path):
@@ -396,14 +766,10 @@ def pull_request(session: Session) -> None:
         )
         pull_request_title = f"Add docset for {LIBRARY_NAME} {library_version}"
         repo_path = f"{GITHUB_USER}/{GITHUB_REPO}"
-        pull_request_body = textwrap.dedent(
-            f"""\
-            {pull_request_title}.
-
-            This pull request was generated by [{repo_path}](https://github.com/{repo_path}).
-        """
+        pull_request_body = _PULL_REQUEST_BODY_TEMPLATE.format(
+            pull_request_title=pull_request_title, repo_path=repo_path
         )
-        branch_name = _make_branch_name(session)
+        branch_name = _make_branch_name()
         session.run(
             "gh",
             "pr",
@@ -419,15 +785,21 @@ def pull_request(session: Session) -> None:
         )
 
 
-@nox.session(python=PYTHON, name="check-types", tags=["lint"])
+@nox.session(python=PYTHON, reuse_venv=True, name="check-types", tags=["lint"])
 def check_types(session: Session) -> None:
     """Check typing with mypy."""
-    session.install("mypy", "nox", CONSTRAINTS_ARG)
+    session.env["PIP_CACHE_DIR"] = os.fsdecode(_PIP_CACHE_PATH.resolve())
+
+    # With the reused venv, repeat runs can skip pip's resolver
+    # entirely once mypy is already installed
+    if not (pathlib.Path(session.virtualenv.location) / "bin" / "mypy").exists():
+        session.install("--prefer-binary", "mypy", "nox", CONSTRAINTS_ARG)
+
     session.run("mypy", "noxfile.py")
 
 
-@nox.session(python=PYTHON)
+@nox.session(python=False)
 def version(session: Session) -> None:
     """Print the doc version."""
-    library_version = _get_library_version(session)
+    library_version = _get_library_version()
     print(library_version)